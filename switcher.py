@@ -12,157 +12,391 @@
 from argparse import ArgumentParser as argumentparser
 # expanduser() returns the home directory of the user.
 from os.path import expanduser
-# configparser() is a neat way for reading and parsing config files.
-from configparser import ConfigParser as configparser
-# isfile() checks the existence of ordinary files.
-from os.path import isfile
-# popen() and run() allow to execute external programs within Python and capture their output.
-from subprocess import Popen as popen
-from subprocess import run
-# sleep() allows to halt the process for a specified amount of time.
-from time import sleep
-# journal class handles logging to systemd. Use journal.send(message) method to write to the systemd journal.
-from systemd import journal
+# shell_split() splits a command string into a list of arguments, respecting quotes like a shell does.
+from shlex import split as shell_split
+# monotonic() returns the time of a clock that cannot go backwards. Used for computing deadlines.
+from time import monotonic
+# poll() waits until one of the registered file descriptors, such as the X server connection, becomes readable.
+from select import poll
+from select import POLLIN
+# close() closes a file descriptor. waitpid() collects the exit status of a child process.
+from os import close
+from os import waitpid
+from os import WNOHANG
+# set_inheritable() controls whether a file descriptor is passed on to the launched program, i.e. the FD_CLOEXEC flag.
+from os import set_inheritable
+# pidfd_open() returns a file descriptor that becomes readable when the process exits. It requires Python 3.9 and Linux 5.3.
+# waitstatus_to_exitcode() converts the exit status to an exit code. It comes with the same Python version.
+try:
+	from os import pidfd_open
+	from os import waitstatus_to_exitcode
+except ImportError:
+	pidfd_open = None
+# The modules for X11 and logging are imported inside the functions that use them.
+# Loading them only when needed keeps the start-up fast, for example when only the usage is printed.
+
+
+# Global variables.
+
+# The connection to the X server. It is opened once by open_display() and shared by all functions.
+x_display = None
+# The root window of the default screen. The EWMH properties of the window manager are stored on it.
+x_root = None
+# The atoms used by the functions. Each atom is interned once by open_display() instead of on every call.
+x_atoms = {}
 
 
 # Functions.
 
 # Closes windows on the given list of windows.
+# The close requests are sent to the window manager as client messages and flushed to the X server all at once.
 def close_windows(windows):
 	for window in windows:
-		run(["wmctrl", "-c", window.get("id", None), "-i"], check="True")
+		send_client_message(window.get("id", None), "_NET_CLOSE_WINDOW", [0, 0, 0, 0, 0])
+	x_display.flush()
 	# All done, return.
 	return None
 
 # Returns the window identifier of the launched process.
 # This uses both window PID and class for detecting the correct window.
 # PID is the primary reference, class is a handy backup for cases where the PID is either unknown or wrong.
-def get_identifier(desktop, window_pid=None, window_class=None, timeout=1.0):
+# Instead of polling the window list, this waits for the window events subscribed to by open_display().
+# If initial_windows is given, it is used for the first check instead of reading the windows again. It must be read after open_display().
+def get_identifier(desktop, window_pid=None, window_class=None, timeout=1.0, initial_windows=None):
+	from Xlib import X
+	from Xlib import Xatom
+	from Xlib.error import BadWindow
+	from Xlib.error import CatchError as catcherror
 	# Check the input arguments.
 	if window_pid is None and window_class is None:
 		raise TypeError("Neither window PID nor class given to get_identifier().")
-	# Set the polling interval in seconds.
-	interval = 0.01
 	# Impose hard limits on the timeout.
 	if timeout < 0.5:
 		timeout = 0.5
 	elif timeout > 60.0:
 		timeout = 60.0
-	# Calculate the timeout_count from the timeout and the interval.
-	timeout_count = int(timeout / interval) + 1
-	# Poll until the identifier can be found.
-	for i in range(timeout_count):
-		# Get the dictionary containing all windows on this desktop.
-		window_pids, window_classes = get_window_info(desktop)
+	# Calculate the deadline from the timeout.
+	deadline = monotonic() + timeout
+	# Wait on the X server connection and, if possible, on the launched process so that a crashed launch is noticed at once.
+	poller = poll()
+	poller.register(x_display, POLLIN)
+	pidfd = None
+	if window_pid is not None and pidfd_open is not None:
+		try:
+			pidfd = pidfd_open(window_pid)
+		except OSError:
+			pidfd = None
+		else:
+			poller.register(pidfd, POLLIN)
+	try:
+		# The window might have appeared before this call, so check the current windows once.
+		# When switch_desktop() gives initial_windows, the list was read before the program was started and its windows
+		# have just been asked to close. The check then cannot find the new window and is a no-op by design. It is kept
+		# for callers that read the list after starting the program. Windows created since open_display() arrive as events anyway.
+		window_pids, window_classes = get_window_info(desktop, initial_windows)
 		# Get the window ID first using the PID. If that fails, use the class.
 		window_id = window_pids.get(window_pid, None)
 		if not window_id:
 			window_id = window_classes.get(window_class, None)
-		# If window ID was found, break the loop. Else wait for the next iteration.
-		if window_id:
-			break
-		sleep(interval)
-	else:
-		# No correct window identifier was found before the timeout was reached.
-		raise RuntimeError("No window ID found before the timeout was reached.")
+		# Wait for the events until the identifier can be found.
+		ready = []
+		while not window_id:
+			# Process the events already received first, one batch at a time. pending_events() checks the socket once per batch
+			# and next_event() does no I/O while the queue is not empty. The connection is polled only once the queue is empty.
+			event_count = x_display.pending_events()
+			for event_number in range(event_count):
+				event = x_display.next_event()
+				if event.type == X.CreateNotify:
+					# The properties of a new window are usually set after its creation. Follow their changes.
+					event.window.change_attributes(event_mask=X.PropertyChangeMask, onerror=catcherror(BadWindow))
+				elif event.type == X.PropertyNotify:
+					# Only the desktop, the PID and the class are of interest.
+					if event.atom not in (x_atoms["_NET_WM_DESKTOP"], x_atoms["_NET_WM_PID"], Xatom.WM_CLASS):
+						continue
+				elif not event.type == X.MapNotify:
+					continue
+				# Check whether the window of the event is the correct one.
+				try:
+					window_properties = get_window_properties(event.window, desktop)
+				except BadWindow:
+					continue
+				if window_properties is None:
+					continue
+				new_pid, new_class = window_properties
+				if (window_pid is not None and new_pid == window_pid) or (window_class is not None and new_class == window_class):
+					window_id = event.window.id
+					break
+			if window_id:
+				break
+			# Check whether the process has exited.
+			if pidfd is not None and pidfd in ready:
+				poller.unregister(pidfd)
+				try:
+					exit_code = waitstatus_to_exitcode(waitpid(window_pid, WNOHANG)[1])
+				except ChildProcessError:
+					# The process is not a child of this one, so its exit code is unknown.
+					exit_code = 0
+				# Launchers often start the actual program and exit successfully. In that case the class can still find the window.
+				if not exit_code == 0:
+					raise RuntimeError("The program exited with code %d before its window was found." %(exit_code))
+			remaining = deadline - monotonic()
+			if remaining <= 0.0:
+				# No correct window identifier was found before the timeout was reached.
+				raise RuntimeError("No window ID found before the timeout was reached.")
+			# More events may have been received while the batch was processed. Handle them before blocking.
+			if event_count:
+				ready = []
+				continue
+			# Block until the X server sends something, the process exits or the timeout is reached.
+			ready = [fd for fd, mask in poller.poll(remaining * 1000.0)]
+	finally:
+		if pidfd is not None:
+			close(pidfd)
 	# All done, return.
 	return window_id
 
-# Returns a list of windows for the desktop given as parameter.
-def get_windows(desktop):
-	# Create the output.
-	windows = []
-	# Get the list of windows using wmctrl.
-	window_listing = run(["wmctrl", "-l", "-x", "-p"], capture_output=True, encoding="utf-8", errors="replace").stdout
-	# Split the listing. The result is a list of strings, one item per line.
-	window_listing = window_listing.strip().split("\n")
-	# Process the listing.
-	for line in window_listing:
-		splitted_line = line.strip().split()
-		# Get the window information.
+# Returns the PID and the class of the given window, or None if the window is not on the given desktop.
+# The desktop is read first so that windows on other desktops cost only one request. Missing values are returned as None.
+# The class is formatted as "instance.class", the instance and class names of WM_CLASS joined with a dot.
+def get_window_properties(window, desktop):
+	from Xlib import Xatom
+	# Read the desktop from the X server and check it.
+	desktop_property = window.get_full_property(x_atoms["_NET_WM_DESKTOP"], Xatom.CARDINAL)
+	if desktop_property is None or not desktop_property.value[0] == desktop:
+		return None
+	# Read the other properties from the X server.
+	pid_property = window.get_full_property(x_atoms["_NET_WM_PID"], Xatom.CARDINAL)
+	class_property = window.get_full_text_property(Xatom.WM_CLASS, Xatom.STRING)
+	# Unpack the values. WM_CLASS holds "instance\0class\0", so the first separator is turned into a dot and the trailing one dropped.
+	window_pid = pid_property.value[0] if pid_property else None
+	window_class = class_property.rstrip("\0").replace("\0", ".", 1) if class_property else None
+	# All done, return.
+	return window_pid, window_class
+
+# Yields the ID, the PID and the class of each window on the desktop given as parameter.
+# The windows are read from the client list maintained by the window manager and filtered by the desktop while reading.
+def iter_windows(desktop):
+	from Xlib import Xatom
+	from Xlib.error import BadWindow
+	# Get the list of window numbers managed by the window manager.
+	client_list = x_root.get_full_property(x_atoms["_NET_CLIENT_LIST"], Xatom.WINDOW)
+	if client_list is None:
+		return
+	# Process the list.
+	for window_number in client_list.value:
+		window = x_display.create_resource_object("window", window_number)
+		# Get the window information. The window might disappear while it is being read.
 		try:
-			window_id = splitted_line[0]
-			window_desktop = int(splitted_line[1])
-			window_pid = int(splitted_line[2])
-			window_class = splitted_line[3]
-			window_hostname = splitted_line[4]
-			window_title = " ".join(splitted_line[5:])
-		except (IndexError, ValueError):
+			window_properties = get_window_properties(window, desktop)
+		except BadWindow:
 			continue
-		if not window_desktop == desktop:
+		if window_properties is None:
 			continue
-		# Append the values.
-		windows.append({
-			"id": window_id,
-			"desktop": window_desktop,
-			"pid": window_pid,
-			"class": window_class,
-			"hostname": window_hostname,
-			"title": window_id
-			})
+		window_pid, window_class = window_properties
+		yield window_number, window_pid, window_class
+
+# Returns the ID of the first window of the given class on the given desktop, or None if there is no such window,
+# and the list of windows read before the match. Reading the windows stops at the first match, so the list is complete
+# only when no match was found. The windows are read only once, whether they are then closed or not.
+def find_window_by_class(desktop, window_class):
+	# Create the output.
+	windows = []
+	# Process the windows of this desktop as they are read.
+	for window_id, window_pid, found_class in iter_windows(desktop):
+		if found_class == window_class:
+			return window_id, windows
+		windows.append({"id": window_id, "pid": window_pid, "class": found_class})
+	# All done, return.
+	return None, windows
+
+# Sends a client message of the given type to the window manager, as specified by EWMH.
+# The message is only queued. Call x_display.flush() to make sure it is sent to the X server.
+def send_client_message(window_number, message_type, data):
+	from Xlib import X
+	from Xlib.protocol.event import ClientMessage as clientmessage
+	message = clientmessage(window=window_number, client_type=x_atoms[message_type], data=(32, data))
+	x_root.send_event(message, event_mask=X.SubstructureRedirectMask|X.SubstructureNotifyMask)
 	# All done, return.
-	return windows
+	return None
 
 # Returns two dictionaries, one containing the PIDs and other the window classes on the specified desktop.
-def get_window_info(desktop):
+# If a list of windows is given, the dictionaries are built from it instead of reading the windows.
+def get_window_info(desktop, windows=None):
 	# Create the output.
 	window_pids = {}
 	window_classes = {}
-	# Get the list of windows for this desktop.
-	windows = get_windows(desktop)
-	# Process the list.
-	for window in windows:
-		# Get the window id, the desktop and the pid.
-		window_id = window.get("id", None)
-		window_class = window.get("class", None)
-		window_pid = window.get("pid", None)
-		if window_id is None or window_class is None or window_pid is None:
-			continue
-		# Add the values.
-		window_pids.update({window_pid: window_id})
-		window_classes.update({window_class: window_id})
+	# Get the windows of this desktop, either as they are read or from the given list.
+	if windows is None:
+		window_rows = iter_windows(desktop)
+	else:
+		window_rows = ((window.get("id", None), window.get("pid", None), window.get("class", None)) for window in windows)
+	# Process the windows.
+	for window_id, window_pid, window_class in window_rows:
+		# Add the values. A window without a PID or a class can still be found using the other one.
+		if window_pid is not None:
+			window_pids.update({window_pid: window_id})
+		if window_class is not None:
+			window_classes.update({window_class: window_id})
 	# All done, return.
 	return window_pids, window_classes
 
+# Opens the connection to the X server and fills the related global variables.
+# The creation and mapping of top-level windows are subscribed to right away, so that no window can appear unnoticed
+# between reading the window list and waiting for the events.
+def open_display():
+	from Xlib import X
+	from Xlib.display import Display as display
+	global x_display, x_root, x_atoms
+	x_display = display()
+	# Python sockets are already non-inheritable (PEP 446), and python-xlib creates its socket with socket.socket.
+	# This only states explicitly that the launched program must not inherit the connection, in case that ever changes.
+	set_inheritable(x_display.fileno(), False)
+	x_root = x_display.screen().root
+	x_root.change_attributes(event_mask=X.SubstructureNotifyMask)
+	x_atoms = {name: x_display.intern_atom(name) for name in (
+		"_NET_ACTIVE_WINDOW",
+		"_NET_CLIENT_LIST",
+		"_NET_CLOSE_WINDOW",
+		"_NET_CURRENT_DESKTOP",
+		"_NET_WM_DESKTOP",
+		"_NET_WM_PID",
+		"_NET_WM_STATE",
+		"_NET_WM_STATE_FULLSCREEN"
+		)}
+	# All done, return.
+	return None
+
+# Reads the config file and returns a dictionary of sections, each of which is a dictionary of keys and values.
+# The config only has flat sections of "key = value" lines, so this small reader replaces the much heavier configparser.
+# It follows configparser where the config could notice: both "=" and ":" separate keys from values, duplicate sections
+# and keys are errors and the keys of the [DEFAULT] section are inherited by the other sections.
+# Interpolation and multi-line values are not supported.
+def read_config(path):
+	# Create the output.
+	config = {}
+	defaults = {}
+	section = None
+	# Process the file line by line.
+	with open(path, encoding="utf-8") as config_file:
+		for line_number, line in enumerate(config_file, start=1):
+			line = line.strip()
+			# Skip empty lines and comments.
+			if not line or line[0] in "#;":
+				continue
+			# Start a new section.
+			if line[0] == "[" and line[-1] == "]":
+				section_name = line[1:-1].strip()
+				if section_name == "DEFAULT":
+					section = defaults
+				elif section_name in config:
+					raise ValueError("Duplicate section '%s' on line %d in the config file." %(section_name, line_number))
+				else:
+					section = config.setdefault(section_name, {})
+				continue
+			# Add a key to the current section. The first "=" or ":" separates the key from the value.
+			separator_index = min(index for index in (line.find("="), line.find(":"), len(line)) if index >= 0)
+			if section is None or separator_index == len(line):
+				raise ValueError("Invalid line %d in the config file." %(line_number))
+			# The keys are case-insensitive, like with configparser.
+			key = line[:separator_index].strip().lower()
+			if key in section:
+				raise ValueError("Duplicate key '%s' on line %d in the config file." %(key, line_number))
+			section.update({key: line[separator_index + 1:].strip()})
+	# Let the sections inherit the defaults.
+	for section_name in config:
+		config[section_name] = dict(defaults, **config[section_name])
+	# All done, return.
+	return config
+
+# Converts a boolean config value to True or False. Accepts the same values as configparser.
+def to_boolean(value):
+	if value.lower() in ("1", "yes", "true", "on"):
+		return True
+	elif value.lower() in ("0", "no", "false", "off"):
+		return False
+	else:
+		raise ValueError("Not a boolean: '%s'." %(value))
+
 # Switches to the desired desktop and launches the program assigned to the desktop.
 def switch_desktop(parameters):
+	from Xlib import X
+	from os import posix_spawnp
+	from os import environ
+	from os import listdir
+	from signal import SIGPIPE
+	from signal import SIGXFSZ
 	# Extract values from the given parameters.
-	command = parameters.get("command", fallback=None)
-	window_class = parameters.get("class", fallback=None)
-	desktop = parameters.getint("desktop", fallback=None)
-	fullscreen = parameters.getboolean("fullscreen", fallback=False)
-	activate = parameters.getboolean("activate", fallback=False)
-	timeout = parameters.getfloat("timeout", fallback=1.0)
+	command = parameters.get("command", None)
+	window_class = parameters.get("class", None)
+	desktop = parameters.get("desktop", None)
+	fullscreen = to_boolean(parameters.get("fullscreen", "no"))
+	activate = to_boolean(parameters.get("activate", "no"))
+	timeout = float(parameters.get("timeout", "1.0"))
 	# Check the values.
 	if command is None or window_class is None or desktop is None:
 		raise ValueError("One of the config keywords 'command', 'class' or 'desktop' is missing.")
-	# Split the command string into a list. Warning: This might be a source of bugs!
-	command_list = command.split()
+	desktop = int(desktop)
+	# Split the command string into a list. Quoted arguments are kept together.
+	command_list = shell_split(command)
+	if not command_list:
+		raise ValueError("The config keyword 'command' is empty.")
 	# Switch to the correct desktop.
-	run(["wmctrl", "-s", str(desktop)], check="True")
+	send_client_message(x_root.id, "_NET_CURRENT_DESKTOP", [desktop, X.CurrentTime, 0, 0, 0])
 	# Check if the program is already running.
-	windows = get_windows(desktop)
-	for window in windows:
-		# This will pick the first matching window! In this use case it does not matter.
-		if window.get("class", None) == window_class:
-			is_running = True
-			window_id = window.get("id", None)
-			break
-	else:
-		is_running = False
+	# This will pick the first matching window! In this use case it does not matter.
+	window_id, windows = find_window_by_class(desktop, window_class)
 	# If the program is not running, i.e. a window of the correct class is not found, close all other windows and start the program.
-	if not is_running:
-		# Close all other windows.
+	if window_id is None:
+		# Close all other windows. The list is also given to get_identifier(), which saves reading it again.
 		close_windows(windows)
-		# Start the program.
-		started_program = popen(command_list)
-		window_id = get_identifier(desktop, window_pid=started_program.pid, window_class=window_class, timeout=timeout)
+		# posix_spawnp() passes on every descriptor that is not close-on-exec, unlike Popen with close_fds=True.
+		# Mark all but the standard streams close-on-exec, so descriptors inherited from e.g. a hotkey daemon do not leak.
+		for fd_name in listdir("/proc/self/fd"):
+			if int(fd_name) > 2:
+				try:
+					set_inheritable(int(fd_name), False)
+				except OSError:
+					# The descriptor used for listing the directory is already closed.
+					pass
+		# Start the program. posix_spawnp() avoids copying the page tables of this process like fork() would.
+		# The program is not waited for, it keeps running after this process exits.
+		# Python ignores SIGPIPE and SIGXFSZ, so they are reset to their defaults for the program, like subprocess does.
+		program_pid = posix_spawnp(command_list[0], command_list, environ, setsigdef=(SIGPIPE, SIGXFSZ))
+		window_id = get_identifier(desktop, window_pid=program_pid, window_class=window_class, timeout=timeout, initial_windows=windows)
 		# Make the program fullscreen.
+		# The first value 1 means adding the state, the fourth value 1 tells that the request comes from an application.
 		if fullscreen:
-			run(["wmctrl", "-r", window_id, "-i", "-b", "add,fullscreen"], check="True")
-	# Activate the window.
+			send_client_message(window_id, "_NET_WM_STATE", [1, x_atoms["_NET_WM_STATE_FULLSCREEN"], 0, 1, 0])
+	# Activate the window. The first value 2 tells that the request comes from a pager.
 	if activate:
-		run(["wmctrl", "-a", window_id, "-i"], check="True")
+		send_client_message(window_id, "_NET_ACTIVE_WINDOW", [2, X.CurrentTime, 0, 0, 0])
+	# Send the queued requests to the X server.
+	x_display.flush()
+	# All done, return.
+	return None
+
+# Writes the message to the systemd journal using its native protocol.
+# If journald is not available and fallback is true, the message is written to the standard error instead.
+def send_to_journal(message, fallback=True):
+	from socket import socket
+	from socket import AF_UNIX
+	from socket import SOCK_DGRAM
+	from struct import pack
+	from sys import stderr
+	# Build the datagram. A message containing newlines must be sent with its length instead of the "KEY=value" form.
+	data = message.encode("utf-8", errors="replace")
+	if b"\n" in data:
+		datagram = b"MESSAGE\n" + pack("<Q", len(data)) + data + b"\n"
+	else:
+		datagram = b"MESSAGE=" + data + b"\n"
+	datagram += b"PRIORITY=6\n"
+	# Send the datagram.
+	try:
+		with socket(AF_UNIX, SOCK_DGRAM) as journal_socket:
+			journal_socket.sendto(datagram, "/run/systemd/journal/socket")
+	except OSError:
+		if fallback:
+			stderr.write(message + "\n")
 	# All done, return.
 	return None
 
@@ -171,7 +405,8 @@ def communicate(message, print_message=True, log_message=True, quit=True, exit_c
 	if print_message:
 		print(message)
 	if log_message:
-		journal.send("[switcher.py] " + message)
+		# A message already printed is not written to the standard error again.
+		send_to_journal("[switcher.py] " + message, fallback=not print_message)
 	if quit:
 		exit(exit_code)
 	# All done, return.
@@ -180,39 +415,44 @@ def communicate(message, print_message=True, log_message=True, quit=True, exit_c
 
 # Main.
 
-# Create a parser for the command line arguments.
-argument_parser = argumentparser(description="Switches between X11 virtual desktops and starts designated software on demand.", allow_abbrev=False)
-argument_parser.add_argument("-d", "--desktop", type=str, help="Switch to desktop DESKTOP, as defined in the config.", required=True)
-argument_parser.add_argument("--config", type=str, default=expanduser("~")+"/.config/switcher.conf", help="Set the config file location.")
-# Parse the arguments.
-arguments = argument_parser.parse_args()
-
-# Create a parser for the config file.
-config = configparser()
-# Chech that the config file exists and read it.
-if isfile(arguments.config):
-	config.read(arguments.config)
-else:
-	argument_parser.print_usage()
-	communicate("error: Config file '%s' not found." %(arguments.config), quit=True)
-
-# Check the arguments and the config.
-if arguments.desktop not in config.sections():
-	argument_parser.print_usage()
-	communicate("error: Unsupported desktop given. Supported values are: '%s'." %("', '".join(config.sections())), quit=True)
-
-# Get the parameters for this instance from the config.
-parameters = config[arguments.desktop]
-
-# Try to switch the desktop.
-try:
-	switch_desktop(parameters)
-except Exception as exception:
-	# Get the values for the logged error message.
-	exception_type = type(exception).__name__
-	exception_message = str(exception)
-	# Log the message and exit with a non-zero exit code to denote an error.
-	communicate("%s: %s" %(exception_type, exception_message), quit=True)
-
-# All done, exit.
-exit(0)
+# Parses the arguments and the config and switches the desktop.
+def main():
+	# Create a parser for the command line arguments.
+	argument_parser = argumentparser(description="Switches between X11 virtual desktops and starts designated software on demand.", allow_abbrev=False)
+	argument_parser.add_argument("-d", "--desktop", type=str, help="Switch to desktop DESKTOP, as defined in the config.", required=True)
+	argument_parser.add_argument("--config", type=str, default=expanduser("~")+"/.config/switcher.conf", help="Set the config file location.")
+	# Parse the arguments.
+	arguments = argument_parser.parse_args()
+
+	# Chech that the config file exists and read it.
+	try:
+		config = read_config(arguments.config)
+	except (FileNotFoundError, IsADirectoryError):
+		argument_parser.print_usage()
+		communicate("error: Config file '%s' not found." %(arguments.config), quit=True)
+	except (OSError, ValueError) as exception:
+		argument_parser.print_usage()
+		communicate("error: Config file '%s' could not be read: %s" %(arguments.config, exception), quit=True)
+
+	# Get the parameters for this instance from the config and check that the desktop is supported.
+	parameters = config.get(arguments.desktop, None)
+	if parameters is None:
+		argument_parser.print_usage()
+		communicate("error: Unsupported desktop given. Supported values are: '%s'." %("', '".join(config)), quit=True)
+
+	# Try to switch the desktop.
+	try:
+		open_display()
+		switch_desktop(parameters)
+	except Exception as exception:
+		# Get the values for the logged error message.
+		exception_type = type(exception).__name__
+		exception_message = str(exception)
+		# Log the message and exit with a non-zero exit code to denote an error.
+		communicate("%s: %s" %(exception_type, exception_message), quit=True)
+
+	# All done, exit.
+	exit(0)
+
+if __name__ == "__main__":
+	main()